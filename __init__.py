@@ -49,63 +49,305 @@ Supported map projections are:
 
 Used formula and parameters can be found here (in Swedish): 
 http://www.lantmateriet.se/geodesi/
+
+Performance: The module has no required dependencies. The pure Python code 
+avoids global state and math.pow, and runs well under PyPy 3, which is the 
+simplest way to speed up scalar conversions. Under CPython, arrays of 
+positions can be converted in one call if NumPy is installed. The formulas 
+are compiled if Numba is installed or if the optional _gk_core Cython 
+extension is built. The compiled array loops release the GIL and run on 
+several cores. With Numba they only run in parallel if the TBB or OpenMP 
+threading layer is available, since the workqueue layer does not allow calls 
+from several Python threads at once.
 """
 
 import math
+import threading
+from functools import lru_cache
+
+# NumPy is optional. If available, arrays of positions can be converted in a 
+# single call.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional. If available, the Gauss-Krüger formulas are compiled to 
+# machine code.
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Options for numba.njit. The fastmath flags leave out 'nnan' and 'ninf' and 
+# the numpy error model is used, so NaN and inf positions give NaN results 
+# instead of raising ZeroDivisionError.
+_JIT_OPTIONS = dict(cache=True, error_model='numpy', 
+                    fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'})
+
+# Optional Cython extension with the array kernels, see _gk_core.pyx.
+try:
+    from . import _gk_core
+except ImportError:
+    _gk_core = None
 
-# Globals used to reuse converter objects.
-rt90_converter = None
-sweref99tm_converter = None
+@lru_cache(maxsize=32)
+def _converter(projection):
+    """ Returns a shared converter object for the projection. """
+    return SwedishGeoPositionConverter(projection)
 
 def rt90_to_sweref99tm(x, y):
     """ Converts from RT 90 2.5 gon V to SWEREF 99 TM. """
-    global rt90_converter
-    global sweref99tm_converter
-    if (rt90_converter == None):
-        rt90_converter = SwedishGeoPositionConverter("rt90_2.5_gon_v")
-    if (sweref99tm_converter == None):
-        sweref99tm_converter = SwedishGeoPositionConverter("sweref_99_tm")
-    lat, long = rt90_converter.gridToGeodetic(x, y)
-    return sweref99tm_converter.geodeticToGrid(lat, long)
+    if not _isArray(x, y):
+        return _rt90_to_sweref99tm_fused(float(x), float(y))
+    lat, long = _converter("rt90_2.5_gon_v").gridToGeodetic(x, y)
+    return _converter("sweref_99_tm").geodeticToGrid(lat, long)
     
 def sweref99tm_to_rt90(n, e):
     """ Converts from SWEREF 99 TM to RT 90 2.5 gon V. """
-    global rt90_converter
-    global sweref99tm_converter
-    if (rt90_converter == None):
-        rt90_converter = SwedishGeoPositionConverter("rt90_2.5_gon_v")
-    if (sweref99tm_converter == None):
-        sweref99tm_converter = SwedishGeoPositionConverter("sweref_99_tm")
-    lat, long = sweref99tm_converter.gridToGeodetic(n, e)
-    return rt90_converter.geodeticToGrid(lat, long)
+    if not _isArray(n, e):
+        return _sweref99tm_to_rt90_fused(float(n), float(e))
+    lat, long = _converter("sweref_99_tm").gridToGeodetic(n, e)
+    return _converter("rt90_2.5_gon_v").geodeticToGrid(lat, long)
     
 def wgs84_to_rt90(lat, long):
     """ Converts from WGS 84 to RT 90 2.5 gon V. """
-    global rt90_converter
-    if (rt90_converter == None):
-        rt90_converter = SwedishGeoPositionConverter("rt90_2.5_gon_v")
-    return rt90_converter.geodeticToGrid(lat, long)
+    return _converter("rt90_2.5_gon_v").geodeticToGrid(lat, long)
     
 def rt90_to_wgs84(x, y):
     """ Converts from RT 90 2.5 gon V to WGS 84. """
-    global rt90_converter
-    if (rt90_converter == None):
-        rt90_converter = SwedishGeoPositionConverter("rt90_2.5_gon_v")
-    return rt90_converter.gridToGeodetic(x, y)
+    return _converter("rt90_2.5_gon_v").gridToGeodetic(x, y)
     
 def wgs84_to_sweref99tm(lat, long):
     """ Converts from WGS 84 to SWEREF 99 TM. """
-    global sweref99tm_converter
-    if (sweref99tm_converter == None):
-        sweref99tm_converter = SwedishGeoPositionConverter("sweref_99_tm")
-    return sweref99tm_converter.geodeticToGrid(lat, long)
+    return _converter("sweref_99_tm").geodeticToGrid(lat, long)
     
 def sweref99tm_to_wgs84(n, e):
     """ Converts from SWEREF 99 TM to WGS 84. """
-    global sweref99tm_converter
-    if (sweref99tm_converter == None):
-        sweref99tm_converter = SwedishGeoPositionConverter("sweref_99_tm")
-    return sweref99tm_converter.gridToGeodetic(n, e)
+    return _converter("sweref_99_tm").gridToGeodetic(n, e)
+
+# Use the log1p form of atanh in the scalar kernels. It is exact for |x| < 1
+# and faster in Numba compiled code, but slower in the CPython interpreter.
+# Fixed at import: Numba treats the global as a compile-time constant, and
+# cached builds keep the value they were compiled with.
+_USE_FAST_ATANH = numba is not None
+
+def _atanh_fast(x):
+    """ atanh(x) written as 0.5*log1p(2x/(1-x)). """
+    return 0.5 * math.log1p(2.0 * x / (1.0 - x))
+
+def _geodetic_to_grid_kernel(phi, lambda_long, lambda_zero, k_a, 
+                             A, B, C, D, beta1, beta2, beta3, beta4, 
+                             false_northing, false_easting):
+    """ Gauss-Krüger formula, geodetic (radians) to grid coordinates. """
+    sin = math.sin
+    cos = math.cos
+    sin_phi = sin(phi)
+    cos_phi = cos(phi)
+    s2 = sin_phi * sin_phi
+    phi_star = phi - sin_phi * cos_phi * (A + s2*(B + s2*(C + s2*D)))
+    delta_lambda = lambda_long - lambda_zero
+    sin_phi_star = sin(phi_star)
+    cos_phi_star = cos(phi_star)
+    sin_delta_lambda = sin(delta_lambda)
+    cos_delta_lambda = cos(delta_lambda)
+    xi_prim = math.atan2(sin_phi_star, cos_phi_star * cos_delta_lambda)
+    if _USE_FAST_ATANH:
+        eta_prim = _atanh_fast(cos_phi_star * sin_delta_lambda)
+    else:
+        eta_prim = math.atanh(cos_phi_star * sin_delta_lambda)
+    # Multiple angles from a single sin/cos pair.
+    sin2 = sin(2.0*xi_prim)
+    cos2 = cos(2.0*xi_prim)
+    sin4 = 2.0 * sin2 * cos2
+    cos4 = 1.0 - 2.0 * sin2 * sin2
+    sin6 = sin4 * cos2 + cos4 * sin2
+    cos6 = cos4 * cos2 - sin4 * sin2
+    sin8 = 2.0 * sin4 * cos4
+    cos8 = 1.0 - 2.0 * sin4 * sin4
+    # Multiple hyperbolic angles from a single expm1.
+    em1 = math.expm1(2.0*eta_prim)
+    inv_e = 1.0 / (1.0 + em1)
+    sinh2 = 0.5 * (em1 + em1*inv_e)
+    cosh2 = 0.5 * (1.0 + em1 + inv_e)
+    sinh4 = 2.0 * sinh2 * cosh2
+    cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+    sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+    cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+    sinh8 = 2.0 * sinh4 * cosh4
+    cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+    north = k_a * (xi_prim + \
+            beta1 * sin2 * cosh2 + \
+            beta2 * sin4 * cosh4 + \
+            beta3 * sin6 * cosh6 + \
+            beta4 * sin8 * cosh8) + \
+            false_northing
+    east = k_a * (eta_prim + \
+            beta1 * cos2 * sinh2 + \
+            beta2 * cos4 * sinh4 + \
+            beta3 * cos6 * sinh6 + \
+            beta4 * cos8 * sinh8) + \
+            false_easting
+    return (north, east)
+
+def _grid_to_geodetic_kernel(north, east, lambda_zero, inv_k_a, 
+                             delta1, delta2, delta3, delta4, 
+                             Astar, Bstar, Cstar, Dstar, 
+                             false_northing, false_easting):
+    """ Gauss-Krüger formula, grid to geodetic coordinates (radians). """
+    sin = math.sin
+    cos = math.cos
+    sinh = math.sinh
+    cosh = math.cosh
+    xi = (north - false_northing) * inv_k_a
+    eta = (east - false_easting) * inv_k_a
+    # Multiple angles from a single sin/cos pair.
+    sin2 = sin(2.0*xi)
+    cos2 = cos(2.0*xi)
+    sin4 = 2.0 * sin2 * cos2
+    cos4 = 1.0 - 2.0 * sin2 * sin2
+    sin6 = sin4 * cos2 + cos4 * sin2
+    cos6 = cos4 * cos2 - sin4 * sin2
+    sin8 = 2.0 * sin4 * cos4
+    cos8 = 1.0 - 2.0 * sin4 * sin4
+    # Multiple hyperbolic angles from a single expm1.
+    em1 = math.expm1(2.0*eta)
+    inv_e = 1.0 / (1.0 + em1)
+    sinh2 = 0.5 * (em1 + em1*inv_e)
+    cosh2 = 0.5 * (1.0 + em1 + inv_e)
+    sinh4 = 2.0 * sinh2 * cosh2
+    cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+    sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+    cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+    sinh8 = 2.0 * sinh4 * cosh4
+    cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+    xi_prim = xi - \
+            delta1*sin2 * cosh2 - \
+            delta2*sin4 * cosh4 - \
+            delta3*sin6 * cosh6 - \
+            delta4*sin8 * cosh8
+    eta_prim = eta - \
+            delta1*cos2 * sinh2 - \
+            delta2*cos4 * sinh4 - \
+            delta3*cos6 * sinh6 - \
+            delta4*cos8 * sinh8
+    # sin(phi_star) is the argument of asin and cos(phi_star) >= 0, so no
+    # further sin/cos calls are needed.
+    sin_phi = sin(xi_prim) / cosh(eta_prim)
+    cos_phi = math.sqrt((1.0 - sin_phi) * (1.0 + sin_phi))
+    phi_star = math.asin(sin_phi)
+    delta_lambda = math.atan2(sinh(eta_prim), cos(xi_prim))
+    lon_radian = lambda_zero + delta_lambda
+    s2 = sin_phi * sin_phi
+    lat_radian = phi_star + sin_phi * cos_phi * \
+            (Astar + s2*(Bstar + s2*(Cstar + s2*Dstar)))
+    return (lat_radian, lon_radian)
+
+def _arrayLoops(loop_range):
+    """ Returns the loops that apply the scalar kernels to 1-d arrays, see 
+        _params. loop_range is range, or numba.prange for parallel loops. 
+        Both variants are built from the same body; as closures over 
+        different values they also get separate Numba cache entries. """
+    def geodetic_to_grid(phi, lambda_long, params, out_north, out_east):
+        """ Applies _geodetic_to_grid_kernel to 1-d arrays. """
+        A, B, C, D = params[0], params[1], params[2], params[3]
+        beta1, beta2, beta3, beta4 = params[4], params[5], params[6], params[7]
+        k_a = params[16]
+        false_northing, false_easting = params[18], params[19]
+        lambda_zero = params[20]
+        for i in loop_range(phi.shape[0]):
+            out_north[i], out_east[i] = _geodetic_to_grid_kernel(
+                    phi[i], lambda_long[i], lambda_zero, k_a, 
+                    A, B, C, D, beta1, beta2, beta3, beta4, 
+                    false_northing, false_easting)
+    def grid_to_geodetic(north, east, params, out_lat, out_lon):
+        """ Applies _grid_to_geodetic_kernel to 1-d arrays. """
+        delta1, delta2 = params[8], params[9]
+        delta3, delta4 = params[10], params[11]
+        Astar, Bstar = params[12], params[13]
+        Cstar, Dstar = params[14], params[15]
+        inv_k_a = params[17]
+        false_northing, false_easting = params[18], params[19]
+        lambda_zero = params[20]
+        for i in loop_range(north.shape[0]):
+            out_lat[i], out_lon[i] = _grid_to_geodetic_kernel(
+                    north[i], east[i], lambda_zero, inv_k_a, 
+                    delta1, delta2, delta3, delta4, 
+                    Astar, Bstar, Cstar, Dstar, 
+                    false_northing, false_easting)
+    return (geodetic_to_grid, grid_to_geodetic)
+
+# Loops over array positions are run in parallel when compiled by Numba, see
+# _arrayKernels for when the serial loops are used instead.
+_geodetic_to_grid_array, _grid_to_geodetic_array = _arrayLoops(
+        range if numba is None else numba.prange)
+_geodetic_to_grid_serial, _grid_to_geodetic_serial = _arrayLoops(range)
+
+if numba is not None:
+    _atanh_fast = numba.njit(**_JIT_OPTIONS)(_atanh_fast)
+    _geodetic_to_grid_kernel = numba.njit(**_JIT_OPTIONS)(
+            _geodetic_to_grid_kernel)
+    _grid_to_geodetic_kernel = numba.njit(**_JIT_OPTIONS)(
+            _grid_to_geodetic_kernel)
+    _geodetic_to_grid_array = numba.njit(parallel=True, nogil=True, 
+            **_JIT_OPTIONS)(_geodetic_to_grid_array)
+    _grid_to_geodetic_array = numba.njit(parallel=True, nogil=True, 
+            **_JIT_OPTIONS)(_grid_to_geodetic_array)
+    _geodetic_to_grid_serial = numba.njit(nogil=True, **_JIT_OPTIONS)(
+            _geodetic_to_grid_serial)
+    _grid_to_geodetic_serial = numba.njit(nogil=True, **_JIT_OPTIONS)(
+            _grid_to_geodetic_serial)
+
+_array_kernels_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def _arrayKernels():
+    """ Returns the array kernels used by the converter: the Cython extension 
+        if built, else the Numba compiled loops. If None, arrays are converted 
+        with NumPy ufuncs. 
+        The parallel Numba loops run without the GIL, but Numba's workqueue 
+        threading layer aborts if they are called from several Python threads 
+        at once. The threading layer is chosen when the first parallel loop 
+        runs, so a small array is converted first and the serial loops are 
+        used if the workqueue layer was chosen. Install TBB (or set 
+        NUMBA_THREADING_LAYER to 'tbb' or 'omp') to run the loops in parallel 
+        from several threads. 
+        With NUMBA_DISABLE_JIT set the loops would run interpreted, so the 
+        NumPy ufuncs are used instead. """
+    if _gk_core is not None:
+        return (_gk_core.geodetic_to_grid, _gk_core.grid_to_geodetic)
+    if (numba is None) or numba.config.DISABLE_JIT:
+        return None
+    with _array_kernels_lock:
+        values = np.zeros(1)
+        _geodetic_to_grid_array(values, values, np.zeros(21), 
+                                np.empty(1), np.empty(1))
+        try:
+            threading_layer = numba.threading_layer()
+        except ValueError:
+            # No threading layer was initialized.
+            threading_layer = 'workqueue'
+        if threading_layer == 'workqueue':
+            return (_geodetic_to_grid_serial, _grid_to_geodetic_serial)
+        return (_geodetic_to_grid_array, _grid_to_geodetic_array)
+
+# Types converted with the NumPy code path, none if NumPy is not installed.
+_ARRAY_TYPES = () if np is None else (np.ndarray, list, tuple)
+
+def _isArray(first, second):
+    """ True if the pair of values should be converted with the NumPy code 
+        path, which is the case if either of them is an array. """
+    return isinstance(first, _ARRAY_TYPES) or isinstance(second, _ARRAY_TYPES)
+
+def _outArray(out, shape):
+    """ Checks a caller supplied output array, or allocates a new one. """
+    if out is None:
+        return np.empty(shape)
+    if (not isinstance(out, np.ndarray)) or (out.shape != shape) or \
+            (out.dtype != np.float64) or (not out.flags.c_contiguous):
+        raise ValueError("Output array must be a C-contiguous float64 array "
+                         "of shape %s." % (shape,))
+    return out
 
 class SwedishGeoPositionConverter(object):
     """
@@ -114,10 +356,19 @@ class SwedishGeoPositionConverter(object):
     used map projections in Sweden. These projections are based on the 
     Bessel 1841, GRS 80 and the SWEREF 99 ellipsoids.   
     """
+    __slots__ = ('_axis', '_flattening', '_central_meridian', 
+                 '_lat_of_origin', '_scale', '_false_northing', 
+                 '_false_easting', '_a_roof', '_A', '_B', '_C', '_D', 
+                 '_beta1', '_beta2', '_beta3', '_beta4', 
+                 '_delta1', '_delta2', '_delta3', '_delta4', 
+                 '_Astar', '_Bstar', '_Cstar', '_Dstar', 
+                 '_deg_to_rad', '_rad_to_deg', '_lambda_zero_rad', 
+                 '_k_a', '_inv_k_a', '_grid_params', '_geodetic_params', 
+                 '_params')
+    
     def __init__(self, projection = "sweref_99_tm"):
         """ """        
         # Local variables.
-        self._initialized = False
         self._axis = 0.0 # Semi-major axis of the ellipsoid.
         self._flattening = 0.0 # Flattening of the ellipsoid.
         self._central_meridian = 0.0 # Central meridian for the projection.
@@ -142,111 +393,394 @@ class SwedishGeoPositionConverter(object):
         self._Bstar = 0.0
         self._Cstar = 0.0
         self._Dstar = 0.0
+        self._deg_to_rad = 0.0
+        self._rad_to_deg = 0.0
+        self._lambda_zero_rad = 0.0 # Central meridian in radians.
+        self._k_a = 0.0 # Scale times a_roof.
+        self._inv_k_a = 0.0
+        self._grid_params = () # Packed arguments for the kernels.
+        self._geodetic_params = ()
+        self._params = None # Packed array for the array kernels.
         # Initial calculations.
         self._setProjection(projection)
         self._prepareEllipsoid()
     
-    def geodeticToGrid(self, latitude, longitude):
+    def geodeticToGrid(self, latitude, longitude, out=None):
         """
         Transformation from geodetic coordinates to grid coordinates.
         @param latitude
         @param longitude
-        @return (north, east)
+        @param out (optional 2-element buffer, e.g. array.array('d', [0, 0]))
+        @return (north, east), or out with north and east stored in it
+        Latitude and longitude may also be arrays (NumPy required), in which
+        case they are broadcast together and a tuple of two arrays is 
+        returned. out must then be None, use geodeticToGridBatch for output 
+        arrays.
         (North corresponds to X in RT 90 and N in SWEREF 99.) 
         (East corresponds to Y in RT 90 and E in SWEREF 99.)
         """
-        if (self._initialized == False):
-            return None
-        deg_to_rad = math.pi / 180.0
-        phi = latitude * deg_to_rad
-        lambda_long = longitude * deg_to_rad
-        lambda_zero = self._central_meridian * deg_to_rad
-        
-        phi_star = phi - math.sin(phi) * math.cos(phi) * (self._A + \
-                self._B*math.pow(math.sin(phi), 2) + \
-                self._C*math.pow(math.sin(phi), 4) + \
-                self._D*math.pow(math.sin(phi), 6))
-        delta_lambda = lambda_long - lambda_zero
-        xi_prim = math.atan(math.tan(phi_star) / math.cos(delta_lambda))
-        eta_prim = math.atanh(math.cos(phi_star) * math.sin(delta_lambda))
-        north = self._scale * self._a_roof * (xi_prim + \
-                self._beta1 * math.sin(2.0*xi_prim) * math.cosh(2.0*eta_prim) + \
-                self._beta2 * math.sin(4.0*xi_prim) * math.cosh(4.0*eta_prim) + \
-                self._beta3 * math.sin(6.0*xi_prim) * math.cosh(6.0*eta_prim) + \
-                self._beta4 * math.sin(8.0*xi_prim) * math.cosh(8.0*eta_prim)) + \
-                self._false_northing
-        east = self._scale * self._a_roof * (eta_prim + \
-                self._beta1 * math.cos(2.0*xi_prim) * math.sinh(2.0*eta_prim) + \
-                self._beta2 * math.cos(4.0*xi_prim) * math.sinh(4.0*eta_prim) + \
-                self._beta3 * math.cos(6.0*xi_prim) * math.sinh(6.0*eta_prim) + \
-                self._beta4 * math.cos(8.0*xi_prim) * math.sinh(8.0*eta_prim)) + \
-                self._false_easting
-#        north = round(north * 1000.0) / 1000.0
-#        east = round(east * 1000.0) / 1000.0
-        return (north, east)
+        if _isArray(latitude, longitude):
+            if out is not None:
+                raise TypeError("out is not supported for arrays, use "
+                                "geodeticToGridBatch.")
+            return self.geodeticToGridBatch(
+                    *np.broadcast_arrays(latitude, longitude))
+        # Positions are converted to float, so NumPy float32 scalars are 
+        # computed in double precision and Numba compiles one specialization.
+        deg_to_rad = self._deg_to_rad
+        phi = float(latitude) * deg_to_rad
+        lambda_long = float(longitude) * deg_to_rad
+        if numba is not None:
+            north, east = _geodetic_to_grid_kernel(phi, lambda_long, 
+                                                   *self._grid_params)
+        else:
+            # Interpreted, the formula is kept inline with local variables 
+            # since a call to the kernel costs as much as it saves. Plain 
+            # sinh/cosh are faster than expm1 here.
+            (lambda_zero, k_a, A, B, C, D, beta1, beta2, beta3, beta4, 
+                    false_northing, false_easting) = self._grid_params
+            sin = math.sin
+            cos = math.cos
+            sin_phi = sin(phi)
+            s2 = sin_phi * sin_phi
+            phi_star = phi - sin_phi * cos(phi) * (A + s2*(B + s2*(C + s2*D)))
+            delta_lambda = lambda_long - lambda_zero
+            cos_phi_star = cos(phi_star)
+            xi_prim = math.atan2(sin(phi_star), 
+                                 cos_phi_star * cos(delta_lambda))
+            eta_prim = math.atanh(cos_phi_star * sin(delta_lambda))
+            sin2 = sin(2.0*xi_prim)
+            cos2 = cos(2.0*xi_prim)
+            sin4 = 2.0 * sin2 * cos2
+            cos4 = 1.0 - 2.0 * sin2 * sin2
+            sin6 = sin4 * cos2 + cos4 * sin2
+            cos6 = cos4 * cos2 - sin4 * sin2
+            sin8 = 2.0 * sin4 * cos4
+            cos8 = 1.0 - 2.0 * sin4 * sin4
+            sinh2 = math.sinh(2.0*eta_prim)
+            cosh2 = math.cosh(2.0*eta_prim)
+            sinh4 = 2.0 * sinh2 * cosh2
+            cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+            sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+            cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+            sinh8 = 2.0 * sinh4 * cosh4
+            cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+            north = k_a * (xi_prim + 
+                    beta1 * sin2 * cosh2 + 
+                    beta2 * sin4 * cosh4 + 
+                    beta3 * sin6 * cosh6 + 
+                    beta4 * sin8 * cosh8) + false_northing
+            east = k_a * (eta_prim + 
+                    beta1 * cos2 * sinh2 + 
+                    beta2 * cos4 * sinh4 + 
+                    beta3 * cos6 * sinh6 + 
+                    beta4 * cos8 * sinh8) + false_easting
+        if out is None:
+            return (north, east)
+        out[0] = north
+        out[1] = east
+        return out
     
-    def gridToGeodetic(self, north, east):
+    def gridToGeodetic(self, north, east, out=None):
         """
         Transformation from grid coordinates to geodetic coordinates.
         @param north (corresponds to X in RT 90 and N in SWEREF 99.)
         @param east (corresponds to Y in RT 90 and E in SWEREF 99.)
-        @return (latitude, longitude)
+        @param out (optional 2-element buffer, e.g. array.array('d', [0, 0]))
+        @return (latitude, longitude), or out with latitude and longitude 
+        stored in it
+        North and east may also be arrays (NumPy required), in which case 
+        they are broadcast together and a tuple of two arrays is returned. 
+        out must then be None, use gridToGeodeticBatch for output arrays.
         """
-        if (self._initialized == False):
-            return None
-
-        deg_to_rad = math.pi / 180
-        lambda_zero = self._central_meridian * deg_to_rad
-        xi = (north - self._false_northing) / (self._scale * self._a_roof)        
-        eta = (east - self._false_easting) / (self._scale * self._a_roof)
+        if _isArray(north, east):
+            if out is not None:
+                raise TypeError("out is not supported for arrays, use "
+                                "gridToGeodeticBatch.")
+            return self.gridToGeodeticBatch(*np.broadcast_arrays(north, east))
+        if numba is not None:
+            lat_radian, lon_radian = _grid_to_geodetic_kernel(float(north), 
+                    float(east), *self._geodetic_params)
+        else:
+            # Interpreted, the formula is kept inline with local variables.
+            (lambda_zero, inv_k_a, delta1, delta2, delta3, delta4, 
+                    Astar, Bstar, Cstar, Dstar, 
+                    false_northing, false_easting) = self._geodetic_params
+            sin = math.sin
+            cos = math.cos
+            xi = (float(north) - false_northing) * inv_k_a
+            eta = (float(east) - false_easting) * inv_k_a
+            sin2 = sin(2.0*xi)
+            cos2 = cos(2.0*xi)
+            sin4 = 2.0 * sin2 * cos2
+            cos4 = 1.0 - 2.0 * sin2 * sin2
+            sin6 = sin4 * cos2 + cos4 * sin2
+            cos6 = cos4 * cos2 - sin4 * sin2
+            sin8 = 2.0 * sin4 * cos4
+            cos8 = 1.0 - 2.0 * sin4 * sin4
+            sinh2 = math.sinh(2.0*eta)
+            cosh2 = math.cosh(2.0*eta)
+            sinh4 = 2.0 * sinh2 * cosh2
+            cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+            sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+            cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+            sinh8 = 2.0 * sinh4 * cosh4
+            cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+            xi_prim = xi - \
+                    delta1*sin2 * cosh2 - \
+                    delta2*sin4 * cosh4 - \
+                    delta3*sin6 * cosh6 - \
+                    delta4*sin8 * cosh8
+            eta_prim = eta - \
+                    delta1*cos2 * sinh2 - \
+                    delta2*cos4 * sinh4 - \
+                    delta3*cos6 * sinh6 - \
+                    delta4*cos8 * sinh8
+            sin_phi = sin(xi_prim) / math.cosh(eta_prim)
+            cos_phi = math.sqrt((1.0 - sin_phi) * (1.0 + sin_phi))
+            lon_radian = lambda_zero + math.atan2(math.sinh(eta_prim), 
+                                                  cos(xi_prim))
+            s2 = sin_phi * sin_phi
+            lat_radian = math.asin(sin_phi) + sin_phi * cos_phi * \
+                    (Astar + s2*(Bstar + s2*(Cstar + s2*Dstar)))
+        rad_to_deg = self._rad_to_deg
+        if out is None:
+            return (lat_radian * rad_to_deg, lon_radian * rad_to_deg)
+        out[0] = lat_radian * rad_to_deg
+        out[1] = lon_radian * rad_to_deg
+        return out
+    
+    def geodeticToGridBatch(self, latitude, longitude, 
+                            out_north=None, out_east=None):
+        """
+        Transformation from geodetic coordinates to grid coordinates for 
+        arrays of positions (NumPy required).
+        @param latitude (array)
+        @param longitude (array, same shape as latitude)
+        @param out_north (optional C-contiguous float64 array for the result)
+        @param out_east (optional C-contiguous float64 array for the result, 
+            must not overlap out_north)
+        @return (out_north, out_east)
+        """
+        latitude = np.require(np.asarray(latitude, dtype=np.float64), 
+                              requirements='C')
+        longitude = np.require(np.asarray(longitude, dtype=np.float64), 
+                               requirements='C')
+        out_north = _outArray(out_north, latitude.shape)
+        out_east = _outArray(out_east, longitude.shape)
+        if (longitude.shape != latitude.shape):
+            raise ValueError("latitude and longitude must have the same shape.")
+        if np.may_share_memory(out_north, out_east):
+            raise ValueError("out_north and out_east must not overlap.")
+        # phi and lambda are new arrays, so the output arrays may overlap 
+        # latitude and longitude.
+        phi = latitude * self._deg_to_rad
+        lambda_long = longitude * self._deg_to_rad
+        array_kernels = _arrayKernels()
+        if array_kernels is not None:
+            array_kernels[0](phi.reshape(-1), lambda_long.reshape(-1), 
+                              self._params, 
+                              out_north.reshape(-1), out_east.reshape(-1))
+            return (out_north, out_east)
+        A, B, C, D = self._A, self._B, self._C, self._D
+        b1, b2, b3, b4 = self._beta1, self._beta2, self._beta3, self._beta4
+        k = self._k_a
+        fn, fe = self._false_northing, self._false_easting
+        sin = np.sin
+        cos = np.cos
+        sin_phi = sin(phi)
+        cos_phi = cos(phi)
+        s2 = sin_phi * sin_phi
+        phi_star = phi - sin_phi * cos_phi * (A + s2*(B + s2*(C + s2*D)))
+        delta_lambda = lambda_long - self._lambda_zero_rad
+        sin_phi_star = sin(phi_star)
+        cos_phi_star = cos(phi_star)
+        xi_prim = np.arctan2(sin_phi_star, cos_phi_star * cos(delta_lambda))
+        eta_prim = np.arctanh(cos_phi_star * sin(delta_lambda))
+        sin2 = sin(2.0*xi_prim)
+        cos2 = cos(2.0*xi_prim)
+        sin4 = 2.0 * sin2 * cos2
+        cos4 = 1.0 - 2.0 * sin2 * sin2
+        sin6 = sin4 * cos2 + cos4 * sin2
+        cos6 = cos4 * cos2 - sin4 * sin2
+        sin8 = 2.0 * sin4 * cos4
+        cos8 = 1.0 - 2.0 * sin4 * sin4
+        # Multiple hyperbolic angles from a single expm1.
+        em1 = np.expm1(2.0*eta_prim)
+        inv_e = 1.0 / (1.0 + em1)
+        sinh2 = 0.5 * (em1 + em1*inv_e)
+        cosh2 = 0.5 * (1.0 + em1 + inv_e)
+        sinh4 = 2.0 * sinh2 * cosh2
+        cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+        sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+        cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+        sinh8 = 2.0 * sinh4 * cosh4
+        cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+        np.multiply(b1 * sin2, cosh2, out=out_north)
+        out_north += b2 * sin4 * cosh4
+        out_north += b3 * sin6 * cosh6
+        out_north += b4 * sin8 * cosh8
+        out_north += xi_prim
+        out_north *= k
+        out_north += fn
+        np.multiply(b1 * cos2, sinh2, out=out_east)
+        out_east += b2 * cos4 * sinh4
+        out_east += b3 * cos6 * sinh6
+        out_east += b4 * cos8 * sinh8
+        out_east += eta_prim
+        out_east *= k
+        out_east += fe
+        return (out_north, out_east)
+    
+    def gridToGeodeticBatch(self, north, east, out_lat=None, out_lon=None):
+        """
+        Transformation from grid coordinates to geodetic coordinates for 
+        arrays of positions (NumPy required).
+        @param north (array)
+        @param east (array, same shape as north)
+        @param out_lat (optional C-contiguous float64 array for the result)
+        @param out_lon (optional C-contiguous float64 array for the result, 
+            must not overlap out_lat)
+        @return (out_lat, out_lon)
+        """
+        north = np.require(np.asarray(north, dtype=np.float64), 
+                           requirements='C')
+        east = np.require(np.asarray(east, dtype=np.float64), 
+                          requirements='C')
+        out_lat = _outArray(out_lat, north.shape)
+        out_lon = _outArray(out_lon, east.shape)
+        if (east.shape != north.shape):
+            raise ValueError("north and east must have the same shape.")
+        if np.may_share_memory(out_lat, out_lon):
+            raise ValueError("out_lat and out_lon must not overlap.")
+        # The kernels store results while reading positions, so inputs that 
+        # overlap the output arrays are copied first.
+        for out in (out_lat, out_lon):
+            if np.may_share_memory(north, out) or \
+                    np.may_share_memory(east, out):
+                north = north.copy()
+                east = east.copy()
+                break
+        array_kernels = _arrayKernels()
+        if array_kernels is not None:
+            array_kernels[1](north.reshape(-1), east.reshape(-1), 
+                              self._params, 
+                              out_lat.reshape(-1), out_lon.reshape(-1))
+            out_lat *= self._rad_to_deg
+            out_lon *= self._rad_to_deg
+            return (out_lat, out_lon)
+        d1, d2, d3, d4 = self._delta1, self._delta2, self._delta3, self._delta4
+        Astar, Bstar = self._Astar, self._Bstar
+        Cstar, Dstar = self._Cstar, self._Dstar
+        inv_k = self._inv_k_a
+        fn, fe = self._false_northing, self._false_easting
+        sin = np.sin
+        cos = np.cos
+        sinh = np.sinh
+        cosh = np.cosh
+        xi = (north - fn) * inv_k
+        eta = (east - fe) * inv_k
+        sin2 = sin(2.0*xi)
+        cos2 = cos(2.0*xi)
+        sin4 = 2.0 * sin2 * cos2
+        cos4 = 1.0 - 2.0 * sin2 * sin2
+        sin6 = sin4 * cos2 + cos4 * sin2
+        cos6 = cos4 * cos2 - sin4 * sin2
+        sin8 = 2.0 * sin4 * cos4
+        cos8 = 1.0 - 2.0 * sin4 * sin4
+        # Multiple hyperbolic angles from a single expm1.
+        em1 = np.expm1(2.0*eta)
+        inv_e = 1.0 / (1.0 + em1)
+        sinh2 = 0.5 * (em1 + em1*inv_e)
+        cosh2 = 0.5 * (1.0 + em1 + inv_e)
+        sinh4 = 2.0 * sinh2 * cosh2
+        cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+        sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+        cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+        sinh8 = 2.0 * sinh4 * cosh4
+        cosh8 = 1.0 + 2.0 * sinh4 * sinh4
         xi_prim = xi - \
-                self._delta1*math.sin(2.0*xi) * math.cosh(2.0*eta) - \
-                self._delta2*math.sin(4.0*xi) * math.cosh(4.0*eta) - \
-                self._delta3*math.sin(6.0*xi) * math.cosh(6.0*eta) - \
-                self._delta4*math.sin(8.0*xi) * math.cosh(8.0*eta)
+                d1*sin2 * cosh2 - \
+                d2*sin4 * cosh4 - \
+                d3*sin6 * cosh6 - \
+                d4*sin8 * cosh8
         eta_prim = eta - \
-                self._delta1*math.cos(2.0*xi) * math.sinh(2.0*eta) - \
-                self._delta2*math.cos(4.0*xi) * math.sinh(4.0*eta) - \
-                self._delta3*math.cos(6.0*xi) * math.sinh(6.0*eta) - \
-                self._delta4*math.cos(8.0*xi) * math.sinh(8.0*eta)
-        phi_star = math.asin(math.sin(xi_prim) / math.cosh(eta_prim))
-        delta_lambda = math.atan(math.sinh(eta_prim) / math.cos(xi_prim))
-        lon_radian = lambda_zero + delta_lambda
-        lat_radian = phi_star + math.sin(phi_star) * math.cos(phi_star) * \
-                (self._Astar + \
-                 self._Bstar*math.pow(math.sin(phi_star), 2) + \
-                 self._Cstar*math.pow(math.sin(phi_star), 4) + \
-                 self._Dstar*math.pow(math.sin(phi_star), 6))      
-        lat = lat_radian * 180.0 / math.pi
-        lon = lon_radian * 180.0 / math.pi
-        return (lat, lon)
+                d1*cos2 * sinh2 - \
+                d2*cos4 * sinh4 - \
+                d3*cos6 * sinh6 - \
+                d4*cos8 * sinh8
+        sin_phi = sin(xi_prim) / cosh(eta_prim)
+        cos_phi = np.sqrt((1.0 - sin_phi) * (1.0 + sin_phi))
+        phi_star = np.arcsin(sin_phi)
+        np.arctan2(sinh(eta_prim), cos(xi_prim), out=out_lon)
+        out_lon += self._lambda_zero_rad
+        out_lon *= self._rad_to_deg
+        s2 = sin_phi * sin_phi
+        np.multiply(sin_phi * cos_phi, 
+                    Astar + s2*(Bstar + s2*(Cstar + s2*Dstar)), out=out_lat)
+        out_lat += phi_star
+        out_lat *= self._rad_to_deg
+        return (out_lat, out_lon)
     
     def _prepareEllipsoid(self):
         """ Prepare calculations only related to the choosen ellipsoid. """
-        if (self._initialized == False):
-            return None
-        
         e2 = self._flattening * (2.0 - self._flattening)
         n = self._flattening / (2.0 - self._flattening)
-        self._a_roof = self._axis / (1.0 + n) * (1.0 + n*n/4.0 + n*n*n*n/64.0)
+        # Powers are computed once. Coefficients are written as literal 
+        # fractions, which are folded to constants when compiled.
+        e4 = e2*e2
+        e6 = e4*e2
+        e8 = e4*e4
+        n2 = n*n
+        n3 = n2*n
+        n4 = n2*n2
+        self._a_roof = self._axis / (1.0 + n) * (1.0 + 0.25*n2 + (1.0/64.0)*n4)
         # Prepare ellipsoid-based stuff for geodetic_to_grid.
         self._A = e2
-        self._B = (5.0*e2*e2 - e2*e2*e2) / 6.0
-        self._C = (104.0*e2*e2*e2 - 45.0*e2*e2*e2*e2) / 120.0
-        self._D = (1237.0*e2*e2*e2*e2) / 1260.0
-        self._beta1 = n/2.0 - 2.0*n*n/3.0 + 5.0*n*n*n/16.0 + 41.0*n*n*n*n/180.0
-        self._beta2 = 13.0*n*n/48.0 - 3.0*n*n*n/5.0 + 557.0*n*n*n*n/1440.0
-        self._beta3 = 61.0*n*n*n/240.0 - 103.0*n*n*n*n/140.0
-        self._beta4 = 49561.0*n*n*n*n/161280.0
+        self._B = (5.0/6.0)*e4 - (1.0/6.0)*e6
+        self._C = (104.0/120.0)*e6 - (45.0/120.0)*e8
+        self._D = (1237.0/1260.0)*e8
+        self._beta1 = 0.5*n - (2.0/3.0)*n2 + (5.0/16.0)*n3 + (41.0/180.0)*n4
+        self._beta2 = (13.0/48.0)*n2 - (3.0/5.0)*n3 + (557.0/1440.0)*n4
+        self._beta3 = (61.0/240.0)*n3 - (103.0/140.0)*n4
+        self._beta4 = (49561.0/161280.0)*n4
         # Prepare ellipsoid-based stuff for grid_to_geodetic.
-        self._delta1 = n/2.0 - 2.0*n*n/3.0 + 37.0*n*n*n/96.0 - n*n*n*n/360.0
-        self._delta2 = n*n/48.0 + n*n*n/15.0 - 437.0*n*n*n*n/1440.0
-        self._delta3 = 17.0*n*n*n/480.0 - 37*n*n*n*n/840.0
-        self._delta4 = 4397.0*n*n*n*n/161280.0
-        self._Astar = e2 + e2*e2 + e2*e2*e2 + e2*e2*e2*e2
-        self._Bstar = -(7.0*e2*e2 + 17.0*e2*e2*e2 + 30.0*e2*e2*e2*e2) / 6.0
-        self._Cstar = (224.0*e2*e2*e2 + 889.0*e2*e2*e2*e2) / 120.0
-        self._Dstar = -(4279.0*e2*e2*e2*e2) / 1260.0
+        self._delta1 = 0.5*n - (2.0/3.0)*n2 + (37.0/96.0)*n3 - (1.0/360.0)*n4
+        self._delta2 = (1.0/48.0)*n2 + (1.0/15.0)*n3 - (437.0/1440.0)*n4
+        self._delta3 = (17.0/480.0)*n3 - (37.0/840.0)*n4
+        self._delta4 = (4397.0/161280.0)*n4
+        self._Astar = e2 + e4 + e6 + e8
+        self._Bstar = -(7.0/6.0)*e4 - (17.0/6.0)*e6 - 5.0*e8
+        self._Cstar = (224.0/120.0)*e6 + (889.0/120.0)*e8
+        self._Dstar = -(4279.0/1260.0)*e8
+        # Constants used on each transformation.
+        self._deg_to_rad = math.pi / 180.0
+        self._rad_to_deg = 180.0 / math.pi
+        self._lambda_zero_rad = self._central_meridian * self._deg_to_rad
+        self._k_a = self._scale * self._a_roof
+        self._inv_k_a = 1.0 / self._k_a
+        # Pack arguments for the Gauss-Krüger kernels.
+        self._grid_params = (self._lambda_zero_rad, self._k_a, 
+                self._A, self._B, self._C, self._D, 
+                self._beta1, self._beta2, self._beta3, self._beta4, 
+                self._false_northing, self._false_easting)
+        self._geodetic_params = (self._lambda_zero_rad, self._inv_k_a, 
+                self._delta1, self._delta2, self._delta3, self._delta4, 
+                self._Astar, self._Bstar, self._Cstar, self._Dstar, 
+                self._false_northing, self._false_easting)
+        # All constants in one contiguous array for the array kernels. The 
+        # order is fixed and used by index in the kernels:
+        #   0-3 A, B, C, D,  4-7 beta1-4,  8-11 delta1-4,  
+        #   12-15 Astar, Bstar, Cstar, Dstar,  16 k_a,  17 inv_k_a,  
+        #   18 false_northing,  19 false_easting,  20 lambda_zero (radians).
+        if np is not None:
+            self._params = np.array([self._A, self._B, self._C, self._D, 
+                    self._beta1, self._beta2, self._beta3, self._beta4, 
+                    self._delta1, self._delta2, self._delta3, self._delta4, 
+                    self._Astar, self._Bstar, self._Cstar, self._Dstar, 
+                    self._k_a, self._inv_k_a, 
+                    self._false_northing, self._false_easting, 
+                    self._lambda_zero_rad], dtype=np.float64)
 
     def _setProjection(self, projection):
         """
@@ -255,148 +789,17 @@ class SwedishGeoPositionConverter(object):
         Bessel and GRS80-ellipsoids.
         Note: Bessel-variants should only be used if lat/long are given as
         RT90-lat/long based on the old Bessel 1841 ellipsoid.
-        Parameter: projection (string). Must match if-statement.
+        Parameter: projection (string). Must be a key in _PROJECTIONS,
+        otherwise ValueError is raised.
         """
-        # RT90 parameters, GRS 80 ellipsoid.
-        if (projection == "rt90_7.5_gon_v"):
-            self._grs80()
-            self._central_meridian = 11.0 + 18.375/60.0
-            self._scale = 1.000006000000
-            self._false_northing = -667.282
-            self._false_easting = 1500025.141
-            self._initialized = True
-        elif (projection == "rt90_5.0_gon_v"):
-            self._grs80()
-            self._central_meridian = 13.0 + 33.376/60.0
-            self._scale = 1.000005800000
-            self._false_northing = -667.130
-            self._false_easting = 1500044.695
-            self._initialized = True
-        elif (projection == "rt90_2.5_gon_v"):
-            self._grs80()
-            self._central_meridian = 15.0 + 48.0/60.0 + 22.624306/3600.0
-            self._scale = 1.00000561024
-            self._false_northing = -667.711
-            self._false_easting = 1500064.274
-            self._initialized = True
-        elif (projection == "rt90_0.0_gon_v"):
-            self._grs80()
-            self._central_meridian = 18.0 + 3.378/60.0
-            self._scale = 1.000005400000
-            self._false_northing = -668.844
-            self._false_easting = 1500083.521
-            self._initialized = True
-        elif (projection == "rt90_2.5_gon_o"):
-            self._grs80()
-            self._central_meridian = 20.0 + 18.379/60.0
-            self._scale = 1.000005200000
-            self._false_northing = -670.706
-            self._false_easting = 1500102.765
-            self._initialized = True
-        elif (projection == "rt90_5.0_gon_o"):
-            self._grs80()
-            self._central_meridian = 22.0 + 33.380/60.0
-            self._scale = 1.000004900000
-            self._false_northing = -672.557
-            self._false_easting = 1500121.846
-            self._initialized = True
-        # RT90 parameters, Bessel 1841 ellipsoid.
-        elif (projection == "bessel_rt90_7.5_gon_v"):
-            self._bessel()
-            self._central_meridian = 11.0 + 18.0/60.0 + 29.8/3600.0
-            self._initialized = True
-        elif (projection == "bessel_rt90_5.0_gon_v"):
-            self._bessel()
-            self._central_meridian = 13.0 + 33.0/60.0 + 29.8/3600.0
-            self._initialized = True
-        elif (projection == "bessel_rt90_2.5_gon_v"):
-            self._bessel()
-            self._central_meridian = 15.0 + 48.0/60.0 + 29.8/3600.0
-            self._initialized = True
-        elif (projection == "bessel_rt90_0.0_gon_v"):
-            self._bessel()
-            self._central_meridian = 18.0 + 3.0/60.0 + 29.8/3600.0
-            self._initialized = True
-        elif (projection == "bessel_rt90_2.5_gon_o"):
-            self._bessel()
-            self._central_meridian = 20.0 + 18.0/60.0 + 29.8/3600.0
-            self._initialized = True
-        elif (projection == "bessel_rt90_5.0_gon_o"):
-            self._bessel()
-            self._central_meridian = 22.0 + 33.0/60.0 + 29.8/3600.0
-            self._initialized = True
-        # SWEREF99TM and SWEREF99ddmm  parameters.
-        elif (projection == "sweref_99_tm"):
-            self._sweref99()
-            self._central_meridian = 15.00
-            self._lat_of_origin = 0.0
-            self._scale = 0.9996
-            self._false_northing = 0.0
-            self._false_easting = 500000.0
-            self._initialized = True
-        elif (projection == "sweref_99_1200"):
-            self._sweref99()
-            self._central_meridian = 12.00
-            self._initialized = True
-        elif (projection == "sweref_99_1330"):
-            self._sweref99()
-            self._central_meridian = 13.50
-            self._initialized = True
-        elif (projection == "sweref_99_1500"):
-            self._sweref99()
-            self._central_meridian = 15.00
-            self._initialized = True
-        elif (projection == "sweref_99_1630"):
-            self._sweref99()
-            self._central_meridian = 16.50
-            self._initialized = True
-        elif (projection == "sweref_99_1800"):
-            self._sweref99()
-            self._central_meridian = 18.00
-            self._initialized = True
-        elif (projection == "sweref_99_1415"):
-            self._sweref99()
-            self._central_meridian = 14.25
-            self._initialized = True
-        elif (projection == "sweref_99_1545"):
-            self._sweref99()
-            self._central_meridian = 15.75
-            self._initialized = True
-        elif (projection == "sweref_99_1715"):
-            self._sweref99()
-            self._central_meridian = 17.25
-            self._initialized = True
-        elif (projection == "sweref_99_1845"):
-            self._sweref99()
-            self._central_meridian = 18.75
-            self._initialized = True
-        elif (projection == "sweref_99_2015"):
-            self._sweref99()
-            self._central_meridian = 20.25
-            self._initialized = True
-        elif (projection == "sweref_99_2145"):
-            self._sweref99()
-            self._central_meridian = 21.75
-            self._initialized = True
-        elif (projection == "sweref_99_2315"):
-            self._sweref99()
-            self._central_meridian = 23.25
-            self._initialized = True
-        # For testing.
-        elif (projection == "test_case"):
-            # Test-case:
-            #    Lat: 66 0'0", long: 24 0'0".
-            #    X:1135809.413803 Y:555304.016555.
-            self._axis = 6378137.0
-            self._flattening = 1.0 / 298.257222101
-            self._central_meridian = 13.0 + 35.0/60.0 + 7.692000/3600.0
-            self._lat_of_origin = 0.0
-            self._scale = 1.000002540000
-            self._false_northing = -6226307.8640
-            self._false_easting = 84182.8790
-            self._initialized = True
-        else:
-            self._initialized = False
+        entry = _PROJECTIONS.get(projection)
+        if entry is None:
+            raise ValueError("Unknown projection %r." % (projection,))
+        # Ellipsoid preset, then projection specific values.
+        entry[0](self)
+        self._central_meridian = entry[1]
+        if len(entry) > 2:
+            self._scale, self._false_northing, self._false_easting = entry[2:]
     
     def _grs80(self):
         """ Default parameters for the GRS80 ellipsoid. """
@@ -421,3 +824,104 @@ class SwedishGeoPositionConverter(object):
         self._scale = 1.0
         self._false_northing = 0.0
         self._false_easting = 150000.0
+
+# Central meridians given as degrees + minutes + seconds. Named constants,
+# evaluated once at import.
+_CM_RT90_75V = 11.0 + 18.375/60.0
+_CM_RT90_50V = 13.0 + 33.376/60.0
+_CM_RT90_25V = 15.0 + 48.0/60.0 + 22.624306/3600.0
+_CM_RT90_00V = 18.0 + 3.378/60.0
+_CM_RT90_25O = 20.0 + 18.379/60.0
+_CM_RT90_50O = 22.0 + 33.380/60.0
+_CM_BESSEL_RT90_75V = 11.0 + 18.0/60.0 + 29.8/3600.0
+_CM_BESSEL_RT90_50V = 13.0 + 33.0/60.0 + 29.8/3600.0
+_CM_BESSEL_RT90_25V = 15.0 + 48.0/60.0 + 29.8/3600.0
+_CM_BESSEL_RT90_00V = 18.0 + 3.0/60.0 + 29.8/3600.0
+_CM_BESSEL_RT90_25O = 20.0 + 18.0/60.0 + 29.8/3600.0
+_CM_BESSEL_RT90_50O = 22.0 + 33.0/60.0 + 29.8/3600.0
+_CM_TEST_CASE = 13.0 + 35.0/60.0 + 7.692000/3600.0
+
+# Map projections. Each entry holds the ellipsoid preset and the central 
+# meridian, optionally followed by scale, false northing and false easting
+# when these differ from the preset.
+_PROJECTIONS = {
+    # RT90 parameters, GRS 80 ellipsoid.
+    "rt90_7.5_gon_v": (SwedishGeoPositionConverter._grs80, 
+                       _CM_RT90_75V, 
+                       1.000006000000, -667.282, 1500025.141),
+    "rt90_5.0_gon_v": (SwedishGeoPositionConverter._grs80, 
+                       _CM_RT90_50V, 
+                       1.000005800000, -667.130, 1500044.695),
+    "rt90_2.5_gon_v": (SwedishGeoPositionConverter._grs80, 
+                       _CM_RT90_25V, 
+                       1.00000561024, -667.711, 1500064.274),
+    "rt90_0.0_gon_v": (SwedishGeoPositionConverter._grs80, 
+                       _CM_RT90_00V, 
+                       1.000005400000, -668.844, 1500083.521),
+    "rt90_2.5_gon_o": (SwedishGeoPositionConverter._grs80, 
+                       _CM_RT90_25O, 
+                       1.000005200000, -670.706, 1500102.765),
+    "rt90_5.0_gon_o": (SwedishGeoPositionConverter._grs80, 
+                       _CM_RT90_50O, 
+                       1.000004900000, -672.557, 1500121.846),
+    # RT90 parameters, Bessel 1841 ellipsoid.
+    "bessel_rt90_7.5_gon_v": (SwedishGeoPositionConverter._bessel, 
+                              _CM_BESSEL_RT90_75V),
+    "bessel_rt90_5.0_gon_v": (SwedishGeoPositionConverter._bessel, 
+                              _CM_BESSEL_RT90_50V),
+    "bessel_rt90_2.5_gon_v": (SwedishGeoPositionConverter._bessel, 
+                              _CM_BESSEL_RT90_25V),
+    "bessel_rt90_0.0_gon_v": (SwedishGeoPositionConverter._bessel, 
+                              _CM_BESSEL_RT90_00V),
+    "bessel_rt90_2.5_gon_o": (SwedishGeoPositionConverter._bessel, 
+                              _CM_BESSEL_RT90_25O),
+    "bessel_rt90_5.0_gon_o": (SwedishGeoPositionConverter._bessel, 
+                              _CM_BESSEL_RT90_50O),
+    # SWEREF99TM and SWEREF99ddmm  parameters.
+    "sweref_99_tm": (SwedishGeoPositionConverter._sweref99, 
+                     15.00, 
+                     0.9996, 0.0, 500000.0),
+    "sweref_99_1200": (SwedishGeoPositionConverter._sweref99, 12.00),
+    "sweref_99_1330": (SwedishGeoPositionConverter._sweref99, 13.50),
+    "sweref_99_1500": (SwedishGeoPositionConverter._sweref99, 15.00),
+    "sweref_99_1630": (SwedishGeoPositionConverter._sweref99, 16.50),
+    "sweref_99_1800": (SwedishGeoPositionConverter._sweref99, 18.00),
+    "sweref_99_1415": (SwedishGeoPositionConverter._sweref99, 14.25),
+    "sweref_99_1545": (SwedishGeoPositionConverter._sweref99, 15.75),
+    "sweref_99_1715": (SwedishGeoPositionConverter._sweref99, 17.25),
+    "sweref_99_1845": (SwedishGeoPositionConverter._sweref99, 18.75),
+    "sweref_99_2015": (SwedishGeoPositionConverter._sweref99, 20.25),
+    "sweref_99_2145": (SwedishGeoPositionConverter._sweref99, 21.75),
+    "sweref_99_2315": (SwedishGeoPositionConverter._sweref99, 23.25),
+    # For testing.
+    # Test-case:
+    #    Lat: 66 0'0", long: 24 0'0".
+    #    X:1135809.413803 Y:555304.016555.
+    "test_case": (SwedishGeoPositionConverter._grs80, 
+                  _CM_TEST_CASE, 
+                  1.000002540000, -6226307.8640, 84182.8790),
+}
+
+# Fixed parameters for the RT 90 2.5 gon V <-> SWEREF 99 TM fast path. When
+# compiled with Numba these global tuples are frozen as constants.
+_RT90_GRID_PARAMS = _converter("rt90_2.5_gon_v")._grid_params
+_RT90_GEODETIC_PARAMS = _converter("rt90_2.5_gon_v")._geodetic_params
+_SWEREF99TM_GRID_PARAMS = _converter("sweref_99_tm")._grid_params
+_SWEREF99TM_GEODETIC_PARAMS = _converter("sweref_99_tm")._geodetic_params
+
+def _rt90_to_sweref99tm_fused(x, y):
+    """ Both transformations in one call, latitude/longitude kept in radians. """
+    phi, lambda_long = _grid_to_geodetic_kernel(x, y, *_RT90_GEODETIC_PARAMS)
+    return _geodetic_to_grid_kernel(phi, lambda_long, *_SWEREF99TM_GRID_PARAMS)
+
+def _sweref99tm_to_rt90_fused(n, e):
+    """ Both transformations in one call, latitude/longitude kept in radians. """
+    phi, lambda_long = _grid_to_geodetic_kernel(n, e, 
+                                                *_SWEREF99TM_GEODETIC_PARAMS)
+    return _geodetic_to_grid_kernel(phi, lambda_long, *_RT90_GRID_PARAMS)
+
+if numba is not None:
+    _rt90_to_sweref99tm_fused = numba.njit(**_JIT_OPTIONS)(
+            _rt90_to_sweref99tm_fused)
+    _sweref99tm_to_rt90_fused = numba.njit(**_JIT_OPTIONS)(
+            _sweref99tm_to_rt90_fused)
@@ -0,0 +1,144 @@
+# -*- coding:utf-8 -*-
+# cython: language_level=3
+# distutils: extra_compile_args = -O3 -ffast-math -march=native -fopenmp
+# distutils: extra_link_args = -fopenmp
+#
+# Project: Plankton Toolbox. http://plankton-toolbox.org
+# License: MIT License, see __init__.py.
+
+"""
+Optional compiled version of the Gauss-Krüger array kernels used by
+SwedishGeoPositionConverter. Build in place with:
+
+    cythonize -i _gk_core.pyx
+
+If the extension is not built, the package falls back to Numba or NumPy.
+The loops run without the GIL and are split over threads with OpenMP.
+Paired sin/cos calls of the same angle are merged into one sincos call by
+GCC, so sincos is not called explicitly.
+Angles are in radians. The params argument is the packed float64 array
+stored as _params on the converter, see _prepareEllipsoid for the order.
+"""
+
+cimport cython
+from cython.parallel cimport prange
+from libc.math cimport sin, cos, asin, atan2, atanh, sinh, cosh, sqrt, expm1
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def geodetic_to_grid(double[::1] phi, double[::1] lambda_long,
+                     const double[::1] params,
+                     double[::1] out_north, double[::1] out_east):
+    """ Geodetic (radians) to grid coordinates for 1-d arrays. """
+    cdef double A = params[0], B = params[1], C = params[2], D = params[3]
+    cdef double beta1 = params[4], beta2 = params[5]
+    cdef double beta3 = params[6], beta4 = params[7]
+    cdef double k_a = params[16]
+    cdef double false_northing = params[18], false_easting = params[19]
+    cdef double lambda_zero = params[20]
+    cdef double sin_phi, cos_phi, s2, phi_star, delta_lambda
+    cdef double sin_phi_star, cos_phi_star
+    cdef double xi_prim, eta_prim
+    cdef double sin2, cos2, sin4, cos4, sin6, cos6, sin8, cos8
+    cdef double em1, inv_e
+    cdef double sinh2, cosh2, sinh4, cosh4, sinh6, cosh6, sinh8, cosh8
+    cdef Py_ssize_t i
+    for i in prange(phi.shape[0], nogil=True, schedule='static'):
+        sin_phi = sin(phi[i])
+        cos_phi = cos(phi[i])
+        s2 = sin_phi * sin_phi
+        phi_star = phi[i] - sin_phi * cos_phi * (A + s2*(B + s2*(C + s2*D)))
+        delta_lambda = lambda_long[i] - lambda_zero
+        sin_phi_star = sin(phi_star)
+        cos_phi_star = cos(phi_star)
+        xi_prim = atan2(sin_phi_star, cos_phi_star * cos(delta_lambda))
+        eta_prim = atanh(cos_phi_star * sin(delta_lambda))
+        sin2 = sin(2.0*xi_prim)
+        cos2 = cos(2.0*xi_prim)
+        sin4 = 2.0 * sin2 * cos2
+        cos4 = 1.0 - 2.0 * sin2 * sin2
+        sin6 = sin4 * cos2 + cos4 * sin2
+        cos6 = cos4 * cos2 - sin4 * sin2
+        sin8 = 2.0 * sin4 * cos4
+        cos8 = 1.0 - 2.0 * sin4 * sin4
+        # Multiple hyperbolic angles from a single expm1.
+        em1 = expm1(2.0*eta_prim)
+        inv_e = 1.0 / (1.0 + em1)
+        sinh2 = 0.5 * (em1 + em1*inv_e)
+        cosh2 = 0.5 * (1.0 + em1 + inv_e)
+        sinh4 = 2.0 * sinh2 * cosh2
+        cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+        sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+        cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+        sinh8 = 2.0 * sinh4 * cosh4
+        cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+        out_north[i] = k_a * (xi_prim +
+                beta1 * sin2 * cosh2 +
+                beta2 * sin4 * cosh4 +
+                beta3 * sin6 * cosh6 +
+                beta4 * sin8 * cosh8) + false_northing
+        out_east[i] = k_a * (eta_prim +
+                beta1 * cos2 * sinh2 +
+                beta2 * cos4 * sinh4 +
+                beta3 * cos6 * sinh6 +
+                beta4 * cos8 * sinh8) + false_easting
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def grid_to_geodetic(const double[::1] north, const double[::1] east,
+                     const double[::1] params,
+                     double[::1] out_lat, double[::1] out_lon):
+    """ Grid to geodetic coordinates (radians) for 1-d arrays. """
+    cdef double delta1 = params[8], delta2 = params[9]
+    cdef double delta3 = params[10], delta4 = params[11]
+    cdef double Astar = params[12], Bstar = params[13]
+    cdef double Cstar = params[14], Dstar = params[15]
+    cdef double inv_k_a = params[17]
+    cdef double false_northing = params[18], false_easting = params[19]
+    cdef double lambda_zero = params[20]
+    cdef double xi, eta, xi_prim, eta_prim, phi_star, sin_phi, cos_phi, s2
+    cdef double sin2, cos2, sin4, cos4, sin6, cos6, sin8, cos8
+    cdef double em1, inv_e
+    cdef double sinh2, cosh2, sinh4, cosh4, sinh6, cosh6, sinh8, cosh8
+    cdef Py_ssize_t i
+    for i in prange(north.shape[0], nogil=True, schedule='static'):
+        xi = (north[i] - false_northing) * inv_k_a
+        eta = (east[i] - false_easting) * inv_k_a
+        sin2 = sin(2.0*xi)
+        cos2 = cos(2.0*xi)
+        sin4 = 2.0 * sin2 * cos2
+        cos4 = 1.0 - 2.0 * sin2 * sin2
+        sin6 = sin4 * cos2 + cos4 * sin2
+        cos6 = cos4 * cos2 - sin4 * sin2
+        sin8 = 2.0 * sin4 * cos4
+        cos8 = 1.0 - 2.0 * sin4 * sin4
+        # Multiple hyperbolic angles from a single expm1.
+        em1 = expm1(2.0*eta)
+        inv_e = 1.0 / (1.0 + em1)
+        sinh2 = 0.5 * (em1 + em1*inv_e)
+        cosh2 = 0.5 * (1.0 + em1 + inv_e)
+        sinh4 = 2.0 * sinh2 * cosh2
+        cosh4 = 1.0 + 2.0 * sinh2 * sinh2
+        sinh6 = sinh4 * cosh2 + cosh4 * sinh2
+        cosh6 = cosh4 * cosh2 + sinh4 * sinh2
+        sinh8 = 2.0 * sinh4 * cosh4
+        cosh8 = 1.0 + 2.0 * sinh4 * sinh4
+        xi_prim = xi - \
+                delta1*sin2 * cosh2 - \
+                delta2*sin4 * cosh4 - \
+                delta3*sin6 * cosh6 - \
+                delta4*sin8 * cosh8
+        eta_prim = eta - \
+                delta1*cos2 * sinh2 - \
+                delta2*cos4 * sinh4 - \
+                delta3*cos6 * sinh6 - \
+                delta4*cos8 * sinh8
+        sin_phi = sin(xi_prim) / cosh(eta_prim)
+        cos_phi = sqrt((1.0 - sin_phi) * (1.0 + sin_phi))
+        phi_star = asin(sin_phi)
+        out_lon[i] = lambda_zero + atan2(sinh(eta_prim), cos(xi_prim))
+        s2 = sin_phi * sin_phi
+        out_lat[i] = phi_star + sin_phi * cos_phi * \
+                (Astar + s2*(Bstar + s2*(Cstar + s2*Dstar)))
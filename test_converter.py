@@ -0,0 +1,297 @@
+# -*- coding:utf-8 -*-
+#
+# Project: Plankton Toolbox. http://plankton-toolbox.org
+# License: MIT License, see __init__.py.
+
+""" Tests for SwedishGeoPositionConverter. Run with pytest. """
+
+import math
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from . import SwedishGeoPositionConverter, rt90_to_sweref99tm, \
+              sweref99tm_to_rt90, wgs84_to_rt90, _PROJECTIONS
+
+NAN = float("nan")
+
+# Results of the original implementation for one position per projection,
+# one degree east of the central meridian: (latitude, longitude, north, east).
+REFERENCE = {
+    "rt90_7.5_gon_v": (56.0, 12.3, 6208378.763535704, 1562027.1670796752),
+    "rt90_5.0_gon_v": (56.5, 14.6, 6264093.62029615, 1564321.8429942848),
+    "rt90_2.5_gon_v": (57.0, 16.8, 6319720.847929285, 1560453.6437219665),
+    "rt90_0.0_gon_v": (57.5, 19.1, 6375442.329565167, 1562657.2592540567),
+    "rt90_2.5_gon_o": (58.0, 21.3, 6431077.5267248005, 1558861.1201637667),
+    "rt90_5.0_gon_o": (58.5, 23.6, 6486805.48869009, 1560972.990333567),
+    "bessel_rt90_7.5_gon_v": (59.0, 12.3, 6542408.351725545, 
+                              1556991.1642064282),
+    "bessel_rt90_5.0_gon_v": (59.5, 14.6, 6598140.8127647955, 
+                              1558994.1165438846),
+    "bessel_rt90_2.5_gon_v": (60.0, 16.8, 6653790.830232975, 
+                              1555329.8849057672),
+    "bessel_rt90_0.0_gon_v": (60.5, 19.1, 6709530.687162894, 
+                              1557240.0417730385),
+    "bessel_rt90_2.5_gon_o": (61.0, 21.3, 6765189.74276606, 
+                              1553651.5326951183),
+    "bessel_rt90_5.0_gon_o": (61.5, 23.6, 6820936.777736769, 
+                              1555468.301981777),
+    "sweref_99_tm": (62.0, 16.0, 6874583.727013308, 552375.7996574836),
+    "sweref_99_1200": (62.5, 13.0, 6933054.6695755515, 201536.0252223407),
+    "sweref_99_1330": (63.0, 14.5, 6988778.577660497, 200671.31251108128),
+    "sweref_99_1500": (63.5, 16.0, 7044506.3373506125, 199802.68627892568),
+    "sweref_99_1630": (64.0, 17.5, 7100237.8996733045, 198930.21291345693),
+    "sweref_99_1800": (64.5, 19.0, 7155973.21448004, 198053.95913275407),
+    "sweref_99_1415": (65.0, 15.2, 7211675.851856665, 194815.43494394474),
+    "sweref_99_1545": (65.5, 16.8, 7267492.574227817, 198604.7318508597),
+    "sweref_99_1715": (66.0, 18.2, 7323165.862442712, 193133.17080202728),
+    "sweref_99_1845": (66.5, 19.8, 7378987.469732931, 196737.9439129809),
+    "sweref_99_2015": (67.0, 21.2, 7434670.076814511, 191437.5669885425),
+    "sweref_99_2145": (67.5, 22.8, 7490496.258106681, 194856.7004165378),
+    "sweref_99_2315": (68.0, 24.2, 7546188.042956958, 189729.14364603677),
+    "test_case": (68.5, 14.6, 1375705.5983744897, 125693.39296192289),
+}
+
+@pytest.fixture(params=["scalar", "interpreted", "numpy", "compiled"])
+def path(request, monkeypatch):
+    """ Code path used by toGrid and toGeodetic in a test. """
+    module = sys.modules[SwedishGeoPositionConverter.__module__]
+    if request.param == "interpreted":
+        monkeypatch.setattr(module, "numba", None)
+    elif request.param == "numpy":
+        pytest.importorskip("numpy")
+        monkeypatch.setattr(module, "_arrayKernels", lambda: None)
+    elif request.param == "compiled":
+        pytest.importorskip("numpy")
+        if module._arrayKernels() is None:
+            pytest.skip("no compiled array kernels")
+    return request.param
+
+def toGrid(converter, path, latitude, longitude):
+    """ geodeticToGrid for one position, as an array on the array paths. """
+    if path in ("scalar", "interpreted"):
+        return converter.geodeticToGrid(latitude, longitude)
+    north, east = converter.geodeticToGrid([latitude], [longitude])
+    return (north[0], east[0])
+
+def toGeodetic(converter, path, north, east):
+    """ gridToGeodetic for one position, as an array on the array paths. """
+    if path in ("scalar", "interpreted"):
+        return converter.gridToGeodetic(north, east)
+    latitude, longitude = converter.gridToGeodetic([north], [east])
+    return (latitude[0], longitude[0])
+
+def test_reference_test_case(path):
+    """ The documented test case: lat 66, long 24. """
+    converter = SwedishGeoPositionConverter("test_case")
+    north, east = toGrid(converter, path, 66.0, 24.0)
+    assert abs(north - 1135809.413803) < 1e-5
+    assert abs(east - 555304.016555) < 1e-5
+    latitude, longitude = toGeodetic(converter, path, north, east)
+    assert abs(latitude - 66.0) < 1e-9 and abs(longitude - 24.0) < 1e-9
+
+def test_reference_projections(path):
+    """ All projections give the results of the original implementation. """
+    assert sorted(REFERENCE) == sorted(_PROJECTIONS)
+    for projection, (lat, lon, north, east) in REFERENCE.items():
+        converter = SwedishGeoPositionConverter(projection)
+        result = toGrid(converter, path, lat, lon)
+        assert abs(result[0] - north) < 1e-6, projection
+        assert abs(result[1] - east) < 1e-6, projection
+        result = toGeodetic(converter, path, north, east)
+        assert abs(result[0] - lat) < 1e-9, projection
+        assert abs(result[1] - lon) < 1e-9, projection
+
+def test_round_trip(path):
+    """ Grid and back over Sweden for all projections. """
+    for projection, entry in _PROJECTIONS.items():
+        converter = SwedishGeoPositionConverter(projection)
+        for lat in (55.0, 59.5, 64.0, 69.0):
+            for lon in (entry[1] - 3.0, entry[1], entry[1] + 3.0):
+                north, east = toGrid(converter, path, lat, lon)
+                result = toGeodetic(converter, path, north, east)
+                assert abs(result[0] - lat) < 1e-9, projection
+                assert abs(result[1] - lon) < 1e-9, projection
+
+def test_reference_fused():
+    """ RT 90 <-> SWEREF 99 TM give the results of the original 
+        implementation. """
+    north, east = rt90_to_sweref99tm(6583052.0, 1628548.0)
+    assert abs(north - 6582882.252191646) < 1e-6
+    assert abs(east - 674261.4751900593) < 1e-6
+    x, y = sweref99tm_to_rt90(6580822.0, 674032.0)
+    assert abs(x - 6580994.193235074) < 1e-6
+    assert abs(y - 1628293.5286595197) < 1e-6
+
+def test_nan_scalar():
+    """ NaN positions give NaN results instead of raising. """
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    for value in converter.geodeticToGrid(NAN, 18.0):
+        assert math.isnan(value)
+    for value in converter.gridToGeodetic(NAN, 500000.0):
+        assert math.isnan(value)
+    for value in converter.gridToGeodetic(6580822.0, NAN):
+        assert math.isnan(value)
+
+def test_nan_fused():
+    """ NaN positions give NaN results in the RT 90 <-> SWEREF 99 TM path. """
+    for value in rt90_to_sweref99tm(NAN, 1628548.0):
+        assert math.isnan(value)
+    for value in sweref99tm_to_rt90(6580822.0, NAN):
+        assert math.isnan(value)
+
+def test_nan_array():
+    """ A NaN position only affects its own element in array conversions. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    north, east = converter.geodeticToGrid(np.array([59.3, NAN]), 
+                                           np.array([18.0, 18.0]))
+    assert np.isnan(north[1]) and np.isnan(east[1])
+    assert np.isfinite(north[0]) and np.isfinite(east[0])
+    lat, lon = converter.gridToGeodetic(np.array([6580822.0, 6580822.0]), 
+                                        np.array([NAN, 674032.0]))
+    assert np.isnan(lat[0]) and np.isnan(lon[0])
+    assert np.isfinite(lat[1]) and np.isfinite(lon[1])
+
+def test_array_threads():
+    """ Array conversions can run in several Python threads at once. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    latitude = np.linspace(55.0, 69.0, 10000)
+    longitude = np.linspace(11.0, 24.0, 10000)
+    expected = converter.geodeticToGrid(latitude, longitude)
+    results = []
+    def convert():
+        results.append(converter.geodeticToGrid(latitude, longitude))
+    threads = [threading.Thread(target=convert) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 4
+    for north, east in results:
+        assert np.array_equal(north, expected[0])
+        assert np.array_equal(east, expected[1])
+
+def test_batch_overlapping_outputs():
+    """ Output arrays may be the input arrays, also in swapped order. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("rt90_2.5_gon_v")
+    latitude = np.linspace(55.0, 69.0, 50)
+    longitude = np.linspace(11.0, 24.0, 50)
+    north, east = converter.geodeticToGridBatch(latitude, longitude)
+    a, b = latitude.copy(), longitude.copy()
+    converter.geodeticToGridBatch(a, b, out_north=b, out_east=a)
+    assert np.allclose(b, north, rtol=0.0, atol=1e-6)
+    assert np.allclose(a, east, rtol=0.0, atol=1e-6)
+    lat, lon = converter.gridToGeodeticBatch(north, east)
+    a, b = north.copy(), east.copy()
+    converter.gridToGeodeticBatch(a, b, out_lat=b, out_lon=a)
+    assert np.allclose(b, lat, rtol=0.0, atol=1e-12)
+    assert np.allclose(a, lon, rtol=0.0, atol=1e-12)
+
+def test_batch_zero_dim():
+    """ 0-d arrays keep their shape. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    north, east = converter.geodeticToGridBatch(np.array(59.3), 
+                                                np.array(18.0))
+    assert north.shape == () and east.shape == ()
+    expected = converter.geodeticToGrid(59.3, 18.0)
+    assert abs(north - expected[0]) < 1e-6
+    assert abs(east - expected[1]) < 1e-6
+    lat, lon = converter.gridToGeodeticBatch(north, east)
+    assert lat.shape == () and lon.shape == ()
+    assert abs(lat - 59.3) < 1e-9 and abs(lon - 18.0) < 1e-9
+
+def test_batch_out_not_array():
+    """ Output buffers that are not NumPy arrays raise ValueError. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    with pytest.raises(ValueError):
+        converter.geodeticToGridBatch(np.array([59.3]), np.array([18.0]), 
+                                      out_north=[0.0])
+    with pytest.raises(ValueError):
+        converter.gridToGeodeticBatch(np.array([6580822.0]), 
+                                      np.array([674032.0]), out_lon=(0.0,))
+
+def test_out_with_arrays():
+    """ out is only used for scalar positions. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    out = np.empty(2)
+    with pytest.raises(TypeError):
+        converter.geodeticToGrid(np.array([59.3]), np.array([18.0]), out=out)
+    with pytest.raises(TypeError):
+        converter.gridToGeodetic([6580822.0], [674032.0], out=out)
+    assert converter.geodeticToGrid(59.3, 18.0, out=out) is out
+
+def test_float32_scalar():
+    """ NumPy float32 scalars are converted in double precision. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    latitude, longitude = np.float32(59.3), np.float32(18.1)
+    expected = converter.geodeticToGrid(float(latitude), float(longitude))
+    north, east = converter.geodeticToGrid(latitude, longitude)
+    assert abs(north - expected[0]) < 1e-6 and abs(east - expected[1]) < 1e-6
+    north, east = converter.geodeticToGrid(np.array([latitude]), 
+                                           np.array([longitude]))
+    assert abs(north[0] - expected[0]) < 1e-6
+    assert abs(east[0] - expected[1]) < 1e-6
+    x, y = np.float32(6583052.0), np.float32(1628548.0)
+    expected = rt90_to_sweref99tm(float(x), float(y))
+    north, east = rt90_to_sweref99tm(x, y)
+    assert abs(north - expected[0]) < 1e-6 and abs(east - expected[1]) < 1e-6
+
+def test_array_disable_jit():
+    """ Arrays are converted with NUMBA_DISABLE_JIT set. """
+    pytest.importorskip("numpy")
+    pytest.importorskip("numba")
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    code = ("import numpy as np; from %s import wgs84_to_rt90; "
+            "print(wgs84_to_rt90(np.array([59.0]), np.array([18.0]))[0][0])" 
+            % os.path.basename(package_dir))
+    env = dict(os.environ, NUMBA_DISABLE_JIT="1")
+    result = subprocess.run([sys.executable, "-c", code], env=env, 
+                            cwd=os.path.dirname(package_dir), 
+                            capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert abs(float(result.stdout) - 
+               wgs84_to_rt90(59.0, 18.0)[0]) < 1e-6
+
+def test_scalar_and_array():
+    """ A scalar and an array are broadcast together. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    north, east = converter.geodeticToGrid(59.0, np.array([18.0, 15.0]))
+    assert north.shape == (2,) and east.shape == (2,)
+    expected = converter.geodeticToGrid(59.0, 15.0)
+    assert abs(north[1] - expected[0]) < 1e-6
+    assert abs(east[1] - expected[1]) < 1e-6
+    lat, lon = converter.gridToGeodetic([6543920.0, 6600000.0], 500000.0)
+    assert lat.shape == (2,) and abs(lon[1] - 15.0) < 1e-9
+    north, east = rt90_to_sweref99tm(6583052.0, [1628548.0, 1628548.0])
+    expected = rt90_to_sweref99tm(6583052.0, 1628548.0)
+    assert abs(north[0] - expected[0]) < 1e-6
+    assert abs(east[1] - expected[1]) < 1e-6
+
+def test_batch_same_out_buffer():
+    """ One buffer for both results raises ValueError. """
+    np = pytest.importorskip("numpy")
+    converter = SwedishGeoPositionConverter("sweref_99_tm")
+    out = np.empty(2)
+    with pytest.raises(ValueError):
+        converter.geodeticToGridBatch(np.array([59.0, 60.0]), 
+                                      np.array([18.0, 15.0]), out, out)
+    with pytest.raises(ValueError):
+        converter.gridToGeodeticBatch(np.array([6543920.0, 6600000.0]), 
+                                      np.array([672319.0, 500000.0]), 
+                                      out_lat=out, out_lon=out)
+
+def test_unknown_projection():
+    """ An unknown projection name raises ValueError. """
+    with pytest.raises(ValueError):
+        SwedishGeoPositionConverter("rt90_10.0_gon_v")